@@ -1,12 +1,24 @@
 """Premium Tax Credit calculation functions."""
 
 import copy
-from policyengine_us import Simulation
+import functools
+
+from policyengine_us import CountryTaxBenefitSystem, Simulation
 
 from aca_calc.calculations.household import build_household_situation
 from aca_calc.calculations.reforms import create_enhanced_ptc_reform
 
 
+@functools.lru_cache(maxsize=1)
+def _get_reform_tbs():
+    """Tax-benefit system with the enhanced PTC reform, built once.
+
+    Building it walks the whole parameter tree (uprating included), which
+    takes several seconds, so every reform calculation reuses one system.
+    """
+    return create_enhanced_ptc_reform()(CountryTaxBenefitSystem())
+
+
 def calculate_ptc(
     age_head,
     age_spouse,
@@ -57,11 +69,13 @@ def calculate_ptc(
         else:
             sit["people"]["you"]["employment_income"] = {2026: income}
 
-        # Create reform if requested
-        reform = create_enhanced_ptc_reform() if use_reform else None
-
-        # Run simulation
-        sim = Simulation(situation=sit, reform=reform)
+        # Run simulation, on the cached reformed system if requested
+        if use_reform:
+            sim = Simulation(
+                situation=sit, tax_benefit_system=_get_reform_tbs()
+            )
+        else:
+            sim = Simulation(situation=sit)
 
         ptc = sim.calculate("aca_ptc", map_to="household", period=2026)[0]
         slcsp = sim.calculate("slcsp", map_to="household", period=2026)[0]
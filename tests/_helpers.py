@@ -0,0 +1,92 @@
+"""Cached PolicyEngine systems and simulation helpers shared by the tests.
+
+Kept out of conftest.py so scripts and test modules can import them as a
+regular module; conftest.py only holds hooks and fixtures.
+"""
+import functools
+
+
+@functools.lru_cache(maxsize=None)
+def get_tbs():
+    """Baseline policyengine_us tax-benefit system, built once per process.
+
+    Scripts that run as __main__ call this directly; pytest tests use the
+    session-scoped `tbs` fixture in conftest.py.
+    """
+    from policyengine_us import CountryTaxBenefitSystem
+
+    return CountryTaxBenefitSystem()
+
+
+def _freeze(reform_dict):
+    """Hashable form of a Reform.from_dict parameter dict."""
+    return tuple(
+        sorted(
+            (path, tuple(sorted(values.items())))
+            for path, values in reform_dict.items()
+        )
+    )
+
+
+@functools.lru_cache(maxsize=8)
+def _reform_tbs(frozen_items):
+    from policyengine_core.reforms import Reform
+    from policyengine_us import CountryTaxBenefitSystem
+
+    reform = Reform.from_dict(
+        {path: dict(values) for path, values in frozen_items},
+        country_id="us",
+    )
+    # Start from a fresh baseline: older policyengine-core reforms share the
+    # baseline's parameter tree, so reforming get_tbs() would rewrite it
+    return reform(CountryTaxBenefitSystem())
+
+
+def get_reform_tbs(reform_dict):
+    """Tax-benefit system with a reform applied, built once per process.
+
+    Pass it as `tax_benefit_system=` instead of `reform=`, so simulations
+    reuse the reformed (and already uprated) parameter tree rather than
+    re-applying the reform each time.
+    """
+    return _reform_tbs(_freeze(reform_dict))
+
+
+# IRA enhanced PTCs extended through 2026, as in the notebook
+IRA_EXTENSION_REFORM = {
+    "gov.aca.ptc_phase_out_rate[0].amount": {"2026-01-01.2100-12-31": 0},
+    "gov.aca.ptc_phase_out_rate[1].amount": {"2025-01-01.2100-12-31": 0},
+    "gov.aca.ptc_phase_out_rate[2].amount": {"2026-01-01.2100-12-31": 0},
+    "gov.aca.ptc_phase_out_rate[3].amount": {"2026-01-01.2100-12-31": 0.02},
+    "gov.aca.ptc_phase_out_rate[4].amount": {"2026-01-01.2100-12-31": 0.04},
+    "gov.aca.ptc_phase_out_rate[5].amount": {"2026-01-01.2100-12-31": 0.06},
+    "gov.aca.ptc_phase_out_rate[6].amount": {"2026-01-01.2100-12-31": 0.085},
+    "gov.aca.ptc_income_eligibility[2].amount": {
+        "2026-01-01.2100-12-31": True
+    },
+}
+
+
+def household_results(situation):
+    """2026 PTC and SLCSP for a situation, under baseline and IRA extension."""
+    from policyengine_us import Simulation
+
+    results = {}
+    for policy, system in (
+        ("baseline", get_tbs()),
+        ("reform", get_reform_tbs(IRA_EXTENSION_REFORM)),
+    ):
+        sim = Simulation(situation=situation, tax_benefit_system=system)
+        ptc = sim.calculate("aca_ptc", map_to="household", period=2026)
+        slcsp = sim.calculate("slcsp", map_to="household", period=2026)
+        results[policy] = {"ptc": ptc[0], "slcsp": slcsp[0]}
+    return results
+
+
+def run_app():
+    """Run the Streamlit app once and return the resulting AppTest."""
+    from streamlit.testing.v1 import AppTest
+
+    at = AppTest.from_file("app.py")
+    at.run()
+    return at
@@ -0,0 +1,181 @@
+"""Situation builders shared by the PolicyEngine tests."""
+
+# 2026 federal poverty guideline for a 2-person household
+FPL_2_PERSON = 21130
+
+
+def adults(ages, income=None, magi=None, state="WV", year=2026):
+    """One tax unit of adults aged `ages`, living in `state`.
+
+    Args:
+        ages: Age of each adult (one for a single filer, two for a couple)
+        income: Household employment income, split evenly between adults
+        magi: ACA MAGI set directly on the tax unit instead of income
+        state: Two-letter state code
+        year: Period for every input
+
+    Returns:
+        dict: PolicyEngine situation dictionary
+    """
+    members = [f"p{i + 1}" for i in range(len(ages))]
+    people = {
+        person: {"age": {year: age}} for person, age in zip(members, ages)
+    }
+    if income is not None:
+        for person in members:
+            people[person]["employment_income"] = {year: income / len(members)}
+
+    tax_unit = {"members": members}
+    if magi is not None:
+        tax_unit["aca_magi"] = {year: magi}
+
+    situation = {
+        "people": people,
+        "families": {"f1": {"members": members}},
+        "spm_units": {"spm1": {"members": members}},
+        "tax_units": {"tu1": tax_unit},
+        "households": {
+            "h1": {"members": members, "state_name": {year: state}}
+        },
+    }
+    if len(members) > 1:
+        situation["marital_units"] = {"mu1": {"members": members}}
+    return situation
+
+
+def single(age, **kwargs):
+    """Single adult; keyword arguments as for `adults`."""
+    return adults((age,), **kwargs)
+
+
+def couple(ages, **kwargs):
+    """Married couple; keyword arguments as for `adults`."""
+    return adults(ages, **kwargs)
+
+
+def texas_couple(income, year=2026):
+    """Notebook Texas couple (ages 25 and 28) in Austin County (FIPS 48015).
+
+    Args:
+        income: Household employment income, split evenly between partners
+        year: Period for every input
+
+    Returns:
+        dict: PolicyEngine situation dictionary
+    """
+    members = ["you", "your partner"]
+    return {
+        "people": {
+            "you": {
+                "age": {year: 25},
+                "employment_income": {year: income / 2},
+            },
+            "your partner": {
+                "age": {year: 28},
+                "employment_income": {year: income / 2},
+            },
+        },
+        "families": {"your family": {"members": members}},
+        "spm_units": {"your household": {"members": members}},
+        "tax_units": {"your tax unit": {"members": members}},
+        "households": {
+            "your household": {
+                "members": members,
+                "state_name": {year: "TX"},
+                "county_fips": {year: "48015"},
+            }
+        },
+        "marital_units": {"your marital unit": {"members": members}},
+    }
+
+
+def with_income(base, per_person_income, year=2026):
+    """Copy of `base` with every person's employment income replaced.
+
+    Only the people are rebuilt; the group entities are shared with `base`,
+    which is never mutated.
+    """
+    return {
+        **base,
+        "people": {
+            name: {**person, "employment_income": {year: per_person_income}}
+            for name, person in base["people"].items()
+        },
+    }
+
+
+def with_income_axis(base, low, high, count, year=2026):
+    """Copy of `base` sweeping every person's employment income together.
+
+    Each person gets a parallel axis from `low` to `high`, so the result
+    holds `count` copies of the household, one per income point. Any fixed
+    employment income on the people is dropped in favour of the axis.
+    """
+    people = {
+        name: {k: v for k, v in person.items() if k != "employment_income"}
+        for name, person in base["people"].items()
+    }
+    return {
+        **base,
+        "people": people,
+        "axes": [
+            [
+                {
+                    "name": "employment_income",
+                    "index": index,
+                    "count": count,
+                    "min": low,
+                    "max": high,
+                    "period": year,
+                }
+                for index in range(len(people))
+            ]
+        ],
+    }
+
+
+def income_grid(incomes, ages=(35,), state="TX", year=2026):
+    """One household of adults per income, all in one situation.
+
+    Setting employment_income for the period itself skips the axes
+    linspace and uprating, so the simulation sees exactly `incomes`.
+    Every household gets its own group entities; PolicyEngine would
+    otherwise build one unit spanning every person in the situation.
+
+    Args:
+        incomes: Employment income of each household, split evenly
+            between its adults
+        ages: Age of each adult (one for a single filer, two for a couple)
+        state: Two-letter state code
+        year: Period for every input
+
+    Returns:
+        dict: PolicyEngine situation dictionary
+    """
+    situation = {
+        "people": {},
+        "families": {},
+        "marital_units": {},
+        "spm_units": {},
+        "tax_units": {},
+        "households": {},
+    }
+    names = ["you", "your partner"][: len(ages)]
+    for i, income in enumerate(incomes):
+        members = [f"{name} {i}" for name in names]
+        for person, age in zip(members, ages):
+            situation["people"][person] = {
+                "age": {year: age},
+                "employment_income": {year: int(income) / len(members)},
+            }
+        situation["families"][f"your family {i}"] = {"members": members}
+        situation["marital_units"][f"your marital unit {i}"] = {
+            "members": members
+        }
+        situation["spm_units"][f"your household {i}"] = {"members": members}
+        situation["tax_units"][f"your tax unit {i}"] = {"members": members}
+        situation["households"][f"your household {i}"] = {
+            "members": members,
+            "state_name": {year: state},
+        }
+    return situation
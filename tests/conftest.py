@@ -0,0 +1,63 @@
+"""Shared pytest fixtures."""
+import os
+from pathlib import Path
+
+import pytest
+
+import _helpers
+
+# Persist numba-compiled kernels across runs. Set before anything imports
+# policyengine_us; pytest-xdist workers inherit it from the controller.
+os.environ.setdefault(
+    "NUMBA_CACHE_DIR", str(Path(__file__).parent / ".numba_cache")
+)
+
+
+def pytest_addoption(parser):
+    parser.addoption(
+        "--debug-tests",
+        action="store_true",
+        default=False,
+        help="Also run exploratory tests marked @pytest.mark.debug",
+    )
+
+
+def pytest_collection_modifyitems(config, items):
+    """Skip @pytest.mark.debug tests unless --debug-tests is given."""
+    if config.getoption("--debug-tests"):
+        return
+    skip = pytest.mark.skip(reason="debug-only; run with --debug-tests")
+    for item in items:
+        if "debug" in item.keywords:
+            item.add_marker(skip)
+
+
+@pytest.fixture(scope="session")
+def tbs():
+    """Pre-warmed baseline tax-benefit system shared by every test.
+
+    Under pytest-xdist each worker process builds its own on first use.
+    """
+    return _helpers.get_tbs()
+
+
+@pytest.fixture(scope="session")
+def app_instance():
+    """Streamlit app run once per session, for read-only inspection."""
+    return _helpers.run_app()
+
+
+@pytest.fixture(scope="session")
+def tx_couple_300fpl():
+    """Notebook Texas couple at 300% FPL ($63,450), simulated once."""
+    from _situations import texas_couple
+
+    return _helpers.household_results(texas_couple(63450))
+
+
+@pytest.fixture(scope="session")
+def tx_couple_400fpl():
+    """Notebook Texas couple at 400% FPL ($84,600), simulated once."""
+    from _situations import texas_couple
+
+    return _helpers.household_results(texas_couple(84600))
@@ -1,66 +1,62 @@
 """Test the 400% FPL cliff."""
-import sys
-sys.path.insert(0, '.')
 
-from app import calculate_ptc, get_fpl
+from policyengine_us import Simulation
 
+from _helpers import get_tbs
+from _situations import FPL_2_PERSON, income_grid
+from aca_calc.calculations.ptc import _get_reform_tbs
 
-def test_cliff_at_400_fpl():
+# Income points as multiples of FPL: just below, at, and above the cliff
+FPL_MULTIPLES = (3.99, 4.0, 4.5)
+
+
+def test_cliff_at_400_fpl(tbs):
     """Test that baseline has cliff at 400% FPL but reform doesn't."""
 
     # 60-year-old couple in WV
-    household_size = 2
-    fpl = get_fpl(household_size)
+    fpl = FPL_2_PERSON
 
     print(f"2-person FPL: ${fpl:,}")
     print(f"400% FPL: ${fpl * 4:,}")
 
-    # Test just below 400% FPL
-    income_below = int(fpl * 3.99)
-    print(f"\nTesting at 399% FPL (${income_below:,}):")
-
-    ptc_reform_below, slcsp = calculate_ptc(60, 60, income_below, [], "WV", None, use_reform=True)
-    ptc_baseline_below, _ = calculate_ptc(60, 60, income_below, [], "WV", None, use_reform=False)
-
-    print(f"  Baseline PTC: ${ptc_baseline_below:,.0f}")
-    print(f"  Reform PTC: ${ptc_reform_below:,.0f}")
-
-    # Test at 400% FPL
-    income_at = int(fpl * 4.0)
-    print(f"\nTesting at 400% FPL (${income_at:,}):")
-
-    ptc_reform_at, _ = calculate_ptc(60, 60, income_at, [], "WV", None, use_reform=True)
-    ptc_baseline_at, _ = calculate_ptc(60, 60, income_at, [], "WV", None, use_reform=False)
-
-    print(f"  Baseline PTC: ${ptc_baseline_at:,.0f}")
-    print(f"  Reform PTC: ${ptc_reform_at:,.0f}")
-
-    # Test above 400% FPL
-    income_above = int(fpl * 4.5)
-    print(f"\nTesting at 450% FPL (${income_above:,}):")
-
-    ptc_reform_above, _ = calculate_ptc(60, 60, income_above, [], "WV", None, use_reform=True)
-    ptc_baseline_above, _ = calculate_ptc(60, 60, income_above, [], "WV", None, use_reform=False)
-
-    print(f"  Baseline PTC: ${ptc_baseline_above:,.0f}")
-    print(f"  Reform PTC: ${ptc_reform_above:,.0f}")
+    incomes = [int(fpl * multiple) for multiple in FPL_MULTIPLES]
+    # Axes only generate evenly spaced incomes, so the three exact points
+    # are three households; one baseline and one reform simulation, on the
+    # app's cached reformed system, cover them all
+    situation = income_grid(incomes, ages=(60, 60), state="WV")
+    sim_baseline = Simulation(situation=situation, tax_benefit_system=tbs)
+    sim_reform = Simulation(
+        situation=situation, tax_benefit_system=_get_reform_tbs()
+    )
+    ptc_baseline = sim_baseline.calculate("aca_ptc", map_to="household", period=2026)
+    ptc_reform = sim_reform.calculate("aca_ptc", map_to="household", period=2026)
+
+    for multiple, income, baseline, reform in zip(
+        FPL_MULTIPLES, incomes, ptc_baseline, ptc_reform
+    ):
+        print(f"\nTesting at {multiple:.0%} FPL (${income:,}):")
+        print(f"  Baseline PTC: ${baseline:,.0f}")
+        print(f"  Reform PTC: ${reform:,.0f}")
+
+    ptc_baseline_above = ptc_baseline[2]
+    ptc_reform_above = ptc_reform[2]
 
     print("\n" + "="*70)
     print("VERIFICATION:")
     print("="*70)
 
     # Baseline should be $0 above 400% FPL
-    if ptc_baseline_above == 0:
-        print("✓ Baseline correctly has cliff (PTC = $0 above 400% FPL)")
-    else:
-        print(f"✗ FAIL: Baseline should be $0 above 400% FPL, got ${ptc_baseline_above:,.0f}")
+    assert ptc_baseline_above == 0, (
+        f"Baseline should be $0 above 400% FPL, got ${ptc_baseline_above:,.0f}"
+    )
+    print("✓ Baseline correctly has cliff (PTC = $0 above 400% FPL)")
 
     # Reform should still have PTC above 400% FPL
-    if ptc_reform_above > 0:
-        print("✓ Reform correctly has no cliff (PTC > $0 above 400% FPL)")
-    else:
-        print(f"✗ FAIL: Reform should have PTC above 400% FPL, got ${ptc_reform_above:,.0f}")
+    assert ptc_reform_above > 0, (
+        f"Reform should have PTC above 400% FPL, got ${ptc_reform_above:,.0f}"
+    )
+    print("✓ Reform correctly has no cliff (PTC > $0 above 400% FPL)")
 
 
 if __name__ == "__main__":
-    test_cliff_at_400_fpl()
+    test_cliff_at_400_fpl(get_tbs())
@@ -1,20 +1,23 @@
 """Test using aca_magi as an axis."""
-import sys
-sys.path.insert(0, '.')
 
 from policyengine_us import Simulation
 
+# Single 35yo in TX; tests only add axes on top, never mutate it
+_BASE_SINGLE_TX = {
+    'people': {'p1': {'age': {2026: 35}}},
+    'families': {'f1': {'members': ['p1']}},
+    'spm_units': {'spm1': {'members': ['p1']}},
+    'tax_units': {'tu1': {'members': ['p1']}},
+    'households': {'h1': {'members': ['p1'], 'state_name': {2026: 'TX'}}},
+}
+
 
 def test_aca_magi_axis():
     """Test using aca_magi as axis variable."""
     print("Testing aca_magi as axis...")
 
     situation = {
-        'people': {'p1': {'age': {2026: 35}}},
-        'families': {'f1': {'members': ['p1']}},
-        'spm_units': {'spm1': {'members': ['p1']}},
-        'tax_units': {'tu1': {'members': ['p1']}},
-        'households': {'h1': {'members': ['p1'], 'state_name': {2026: 'TX'}}},
+        **_BASE_SINGLE_TX,
         'axes': [[{
             'name': 'aca_magi',
             'period': 2026,
@@ -41,11 +44,7 @@ def test_employment_income_axis():
     print("\nTesting employment_income as axis...")
 
     situation = {
-        'people': {'p1': {'age': {2026: 35}}},
-        'families': {'f1': {'members': ['p1']}},
-        'spm_units': {'spm1': {'members': ['p1']}},
-        'tax_units': {'tu1': {'members': ['p1']}},
-        'households': {'h1': {'members': ['p1'], 'state_name': {2026: 'TX'}}},
+        **_BASE_SINGLE_TX,
         'axes': [[{
             'name': 'employment_income',
             'count': 5,
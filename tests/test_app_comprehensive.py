@@ -1,19 +1,20 @@
 """
 Comprehensive verification test for the fixed app.py
 Tests all critical scenarios to ensure calculations match notebook values
+
+Each scenario is an independent parametrized case, so the file can be
+spread across workers with pytest-xdist: pytest -n auto
 """
 import sys
-sys.path.insert(0, '.')
 
-# Import the fixed calculate_ptc function from app.py
-from app import calculate_ptc
+import pytest
+
+from aca_calc.calculations.ptc import calculate_ptc
 
-print("="*70)
-print("COMPREHENSIVE APP VERIFICATION TEST")
-print("="*70)
+TOLERANCE = 100  # Allow $100 difference due to rounding
 
 # Test scenarios from notebook
-test_cases = [
+TEST_CASES = [
     {
         "name": "Texas couple at 300% FPL ($63,450)",
         "age_head": 25,
@@ -71,107 +72,66 @@ test_cases = [
     },
 ]
 
-passed = 0
-failed = 0
-tolerance = 100  # Allow $100 difference due to rounding
-
-for i, test in enumerate(test_cases, 1):
-    print(f"\n{'='*70}")
-    print(f"TEST {i}: {test['name']}")
-    print(f"{'='*70}")
 
+@pytest.mark.parametrize("case", TEST_CASES, ids=lambda c: c["name"])
+def test_case(case):
+    """Baseline and reform PTC match the notebook values."""
     # Calculate baseline
-    ptc_baseline, slcsp = calculate_ptc(
-        test['age_head'],
-        test['age_spouse'],
-        test['income'],
-        test['dependent_ages'],
-        test['state'],
-        test['county'],
+    ptc_baseline, slcsp, _, _ = calculate_ptc(
+        case['age_head'],
+        case['age_spouse'],
+        case['income'],
+        case['dependent_ages'],
+        case['state'],
+        case['county'],
         use_reform=False
     )
 
     # Calculate reform
-    ptc_reform, _ = calculate_ptc(
-        test['age_head'],
-        test['age_spouse'],
-        test['income'],
-        test['dependent_ages'],
-        test['state'],
-        test['county'],
+    ptc_reform, _, _, _ = calculate_ptc(
+        case['age_head'],
+        case['age_spouse'],
+        case['income'],
+        case['dependent_ages'],
+        case['state'],
+        case['county'],
         use_reform=True
     )
 
-    # Check results
-    baseline_diff = abs(ptc_baseline - test['expected_baseline'])
-    reform_diff = abs(ptc_reform - test['expected_reform'])
-
-    baseline_ok = baseline_diff < tolerance
-    reform_ok = reform_diff < tolerance
-
-    print(f"\nBaseline PTC:")
-    print(f"  Expected: ${test['expected_baseline']:,.0f}")
-    print(f"  Got:      ${ptc_baseline:,.0f}")
-    print(f"  Diff:     ${baseline_diff:,.0f}")
-    print(f"  Status:   {'✓ PASS' if baseline_ok else '✗ FAIL'}")
-
-    print(f"\nReform PTC:")
-    print(f"  Expected: ${test['expected_reform']:,.0f}")
-    print(f"  Got:      ${ptc_reform:,.0f}")
-    print(f"  Diff:     ${reform_diff:,.0f}")
-    print(f"  Status:   {'✓ PASS' if reform_ok else '✗ FAIL'}")
-
-    print(f"\nSLCSP: ${slcsp:,.0f}/year")
-    print(f"Difference (Reform - Baseline): ${ptc_reform - ptc_baseline:,.0f}")
-
-    if baseline_ok and reform_ok:
-        print(f"\n✓ TEST {i} PASSED")
-        passed += 1
-    else:
-        print(f"\n✗ TEST {i} FAILED")
-        failed += 1
-
-# Edge case tests
-print(f"\n{'='*70}")
-print("EDGE CASE TESTS")
-print(f"{'='*70}")
-
-# Test with multiple children
-print(f"\n--- Test: Family with 3 children ---")
-ptc_base, slcsp = calculate_ptc(35, 35, 80000, [5, 8, 12], "TX", None, use_reform=False)
-ptc_ref, _ = calculate_ptc(35, 35, 80000, [5, 8, 12], "TX", None, use_reform=True)
-print(f"Baseline: ${ptc_base:,.0f}, Reform: ${ptc_ref:,.0f}, SLCSP: ${slcsp:,.0f}")
-if ptc_ref > ptc_base and slcsp > 0:
-    print("✓ PASS - Reform gives higher benefit and SLCSP exists")
-    passed += 1
-else:
-    print("✗ FAIL - Something wrong with multi-child calculation")
-    failed += 1
-
-# Test single person
-print(f"\n--- Test: Single person at 250% FPL ---")
-ptc_base, slcsp = calculate_ptc(40, None, 40000, [], "TX", None, use_reform=False)
-ptc_ref, _ = calculate_ptc(40, None, 40000, [], "TX", None, use_reform=True)
-print(f"Baseline: ${ptc_base:,.0f}, Reform: ${ptc_ref:,.0f}, SLCSP: ${slcsp:,.0f}")
-if ptc_ref >= ptc_base and slcsp > 0:
-    print("✓ PASS - Single person calculation works")
-    passed += 1
-else:
-    print("✗ FAIL - Single person calculation issue")
-    failed += 1
-
-# Summary
-print(f"\n{'='*70}")
-print("FINAL RESULTS")
-print(f"{'='*70}")
-print(f"Passed: {passed}")
-print(f"Failed: {failed}")
-print(f"Total:  {passed + failed}")
-
-if failed == 0:
-    print("\n✓✓✓ ALL TESTS PASSED! ✓✓✓")
-    print("The app is working correctly!")
-else:
-    print(f"\n✗ {failed} test(s) failed. Review issues above.")
-
-sys.exit(0 if failed == 0 else 1)
\ No newline at end of file
+    print(f"\n{case['name']}")
+    print(f"  Baseline: ${ptc_baseline:,.0f} (expected ${case['expected_baseline']:,.0f})")
+    print(f"  Reform:   ${ptc_reform:,.0f} (expected ${case['expected_reform']:,.0f})")
+    print(f"  SLCSP:    ${slcsp:,.0f}/year")
+
+    assert abs(ptc_baseline - case['expected_baseline']) < TOLERANCE, (
+        f"Baseline PTC ${ptc_baseline:,.0f} != "
+        f"expected ${case['expected_baseline']:,.0f}"
+    )
+    assert abs(ptc_reform - case['expected_reform']) < TOLERANCE, (
+        f"Reform PTC ${ptc_reform:,.0f} != "
+        f"expected ${case['expected_reform']:,.0f}"
+    )
+
+
+def test_family_with_three_children():
+    """Reform gives a higher benefit and SLCSP exists for a family of 5."""
+    ptc_base, slcsp, _, _ = calculate_ptc(35, 35, 80000, [5, 8, 12], "TX", None, use_reform=False)
+    ptc_ref, _, _, _ = calculate_ptc(35, 35, 80000, [5, 8, 12], "TX", None, use_reform=True)
+    print(f"Baseline: ${ptc_base:,.0f}, Reform: ${ptc_ref:,.0f}, SLCSP: ${slcsp:,.0f}")
+
+    assert slcsp > 0, "SLCSP should be > 0"
+    assert ptc_ref > ptc_base, "Something wrong with multi-child calculation"
+
+
+def test_single_person_250_fpl():
+    """Single person at 250% FPL gets at least the baseline credit."""
+    ptc_base, slcsp, _, _ = calculate_ptc(40, None, 40000, [], "TX", None, use_reform=False)
+    ptc_ref, _, _, _ = calculate_ptc(40, None, 40000, [], "TX", None, use_reform=True)
+    print(f"Baseline: ${ptc_base:,.0f}, Reform: ${ptc_ref:,.0f}, SLCSP: ${slcsp:,.0f}")
+
+    assert slcsp > 0, "SLCSP should be > 0"
+    assert ptc_ref >= ptc_base, "Single person calculation issue"
+
+
+if __name__ == "__main__":
+    sys.exit(pytest.main([__file__, "-v"]))
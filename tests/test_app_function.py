@@ -13,7 +13,6 @@ def calculate_ptc(age_head, age_spouse, income, dependent_ages, state, use_refor
                 "you": {"age": {2026: age_head}}
             },
             "families": {"your family": {"members": ["you"]}},
-            "spm_units": {"your household": {"members": ["you"]}},
             "tax_units": {"your tax unit": {"members": ["you"]}},
             "households": {
                 "your household": {
@@ -32,13 +31,18 @@ def calculate_ptc(age_head, age_spouse, income, dependent_ages, state, use_refor
                 "employment_income": {2026: income / 2}
             }
             household["families"]["your family"]["members"].append("your partner")
-            household["spm_units"]["your household"]["members"].append("your partner")
             household["tax_units"]["your tax unit"]["members"].append("your partner")
             household["households"]["your household"]["members"].append("your partner")
-            household["marital_units"] = {"your marital unit": {"members": ["you", "your partner"]}}
         else:
             household["people"]["you"]["employment_income"] = {2026: income}
 
+        # Unspecified group entities (spm_units, marital_units) default to
+        # one unit holding everyone, which is already right for adults only.
+        # Dependents need their own marital units, so emit them only then.
+        if dependent_ages:
+            adults = list(household["people"])
+            household["marital_units"] = {"your marital unit": {"members": adults}}
+
         # Add dependents with proper marital unit structure
         for i, dep_age in enumerate(dependent_ages):
             child_id = f"your child {i+1}" if i == 0 else f"your child {i+1}"
@@ -51,13 +55,10 @@ def calculate_ptc(age_head, age_spouse, income, dependent_ages, state, use_refor
 
             household["people"][child_id] = {"age": {2026: dep_age}}
             household["families"]["your family"]["members"].append(child_id)
-            household["spm_units"]["your household"]["members"].append(child_id)
             household["tax_units"]["your tax unit"]["members"].append(child_id)
             household["households"]["your household"]["members"].append(child_id)
 
             # Add child's marital unit
-            if "marital_units" not in household:
-                household["marital_units"] = {}
             household["marital_units"][f"{child_id}'s marital unit"] = {
                 "members": [child_id],
                 "marital_unit_id": {2026: i + (2 if age_spouse else 1)}
@@ -1,6 +1,4 @@
 """Test that app imports and basic functions work."""
-import sys
-sys.path.insert(0, '.')
 
 
 def test_app_imports():
@@ -2,9 +2,7 @@
 
 import sys
 
-sys.path.insert(0, ".")
-
-from app import calculate_ptc
+from aca_calc.calculations.ptc import calculate_ptc
 
 
 def test_simple_calculation():
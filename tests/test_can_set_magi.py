@@ -1,54 +1,27 @@
 """Test if we can set aca_magi directly."""
 import sys
-sys.path.insert(0, '.')
 
+import pytest
 from policyengine_us import Simulation
 
+from _situations import single
 
-def test_set_aca_magi():
-    """Test if aca_magi can be set as input."""
-    print("Testing if we can set aca_magi as input...")
 
-    situation = {
-        'people': {'p1': {'age': {2026: 35}}},
-        'families': {'f1': {'members': ['p1']}},
-        'spm_units': {'spm1': {'members': ['p1']}},
-        'tax_units': {'tu1': {'members': ['p1'], 'aca_magi': {2026: 50000}}},
-        'households': {'h1': {'members': ['p1'], 'state_name': {2026: 'TX'}}}
-    }
+@pytest.mark.parametrize(
+    "inputs",
+    [{"magi": 50000}, {"income": 50000}],
+    ids=["aca_magi", "employment_income"],
+)
+def test_set_aca_magi(tbs, inputs):
+    """aca_magi resolves whether set directly or derived from income."""
+    situation = single(35, state="TX", **inputs)
 
-    try:
-        sim = Simulation(situation=situation)
-        magi = sim.calculate('aca_magi', period=2026)[0]
-        print(f"✓ Successfully set and retrieved aca_magi: ${magi:,.0f}")
-    except Exception as e:
-        print(f"✗ Cannot set aca_magi: {e}")
-        return False
-
-    return True
-
-
-def test_set_employment_income():
-    """Test traditional employment_income approach."""
-    print("\nTesting employment_income approach...")
-
-    situation = {
-        'people': {'p1': {'age': {2026: 35}, 'employment_income': {2026: 50000}}},
-        'families': {'f1': {'members': ['p1']}},
-        'spm_units': {'spm1': {'members': ['p1']}},
-        'tax_units': {'tu1': {'members': ['p1']}},
-        'households': {'h1': {'members': ['p1'], 'state_name': {2026: 'TX'}}}
-    }
-
-    sim = Simulation(situation=situation)
+    sim = Simulation(situation=situation, tax_benefit_system=tbs)
     magi = sim.calculate('aca_magi', period=2026)[0]
-    print(f"✓ Employment income → aca_magi: ${magi:,.0f}")
+    print(f"✓ {', '.join(inputs)} → aca_magi: ${magi:,.0f}")
 
+    assert magi == pytest.approx(50000)
 
-if __name__ == "__main__":
-    if test_set_aca_magi():
-        print("\n✅ aca_magi can be set directly!")
-    else:
-        print("\n⚠️ aca_magi cannot be set directly, must use income sources")
 
-    test_set_employment_income()
+if __name__ == "__main__":
+    sys.exit(pytest.main([__file__, "-v", "-s"]))
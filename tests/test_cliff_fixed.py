@@ -1,18 +1,17 @@
 """Test cliff works with employment_income."""
-import sys
-sys.path.insert(0, '.')
 
-from app import calculate_ptc, get_fpl
+from _situations import FPL_2_PERSON
+from aca_calc.calculations.ptc import calculate_ptc
 
 # 60yo couple
-fpl_2 = get_fpl(2)
+fpl_2 = FPL_2_PERSON
 income_at_405_fpl = int(fpl_2 * 4.05)
 
 print(f"Testing 60yo couple at 405% FPL (${income_at_405_fpl:,})")
 print(f"FPL for 2: ${fpl_2:,}, 400% FPL: ${fpl_2 * 4:,}")
 
-ptc_baseline, slcsp = calculate_ptc(60, 60, income_at_405_fpl, [], "WV", None, use_reform=False)
-ptc_reform, _ = calculate_ptc(60, 60, income_at_405_fpl, [], "WV", None, use_reform=True)
+ptc_baseline, slcsp, _, _ = calculate_ptc(60, 60, income_at_405_fpl, [], "WV", None, use_reform=False)
+ptc_reform, _, _, _ = calculate_ptc(60, 60, income_at_405_fpl, [], "WV", None, use_reform=True)
 
 print(f"\nBaseline PTC (should be $0): ${ptc_baseline:,.0f}")
 print(f"Reform PTC (should be >$0): ${ptc_reform:,.0f}")
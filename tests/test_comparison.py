@@ -1,5 +1,9 @@
 from policyengine_us import Simulation
 
+from _helpers import get_tbs
+
+tbs = get_tbs()
+
 print("Testing different household structures to find the discrepancy...\n")
 
 # Test 1: Exact match to our test script
@@ -57,37 +61,62 @@ household_v3 = {
     }
 }
 
-print("Version 1: Age 35->36, no county")
-sim = Simulation(situation=household_v1)
-ptc_2025 = sim.calculate("aca_ptc", map_to="household", period=2025)[0]
-ptc_2026 = sim.calculate("aca_ptc", map_to="household", period=2026)[0]
-print(f"  2025: ${ptc_2025:,.2f}")
-print(f"  2026: ${ptc_2026:,.2f}")
-print(f"  Difference: ${ptc_2025 - ptc_2026:,.2f}\n")
-
-print("Version 2: Age stays 35, no county")
-sim = Simulation(situation=household_v2)
-ptc_2025 = sim.calculate("aca_ptc", map_to="household", period=2025)[0]
-ptc_2026 = sim.calculate("aca_ptc", map_to="household", period=2026)[0]
-print(f"  2025: ${ptc_2025:,.2f}")
-print(f"  2026: ${ptc_2026:,.2f}")
-print(f"  Difference: ${ptc_2025 - ptc_2026:,.2f}\n")
-
-print("Version 3: Age 35, with Essex County")
-sim = Simulation(situation=household_v3)
-ptc_2025 = sim.calculate("aca_ptc", map_to="household", period=2025)[0]
-ptc_2026 = sim.calculate("aca_ptc", map_to="household", period=2026)[0]
-print(f"  2025: ${ptc_2025:,.2f}")
-print(f"  2026: ${ptc_2026:,.2f}")
-print(f"  Difference: ${ptc_2025 - ptc_2026:,.2f}\n")
-
-# Check SLCSP differences
+
+# Group entities PolicyEngine would otherwise fill with one all-person unit
+GROUP_ENTITIES = ("families", "spm_units", "tax_units", "households", "marital_units")
+
+
+def merge_situations(situations):
+    """Combine single-household situations into one, suffixing ids by index.
+
+    PolicyEngine evaluates every household of a situation in one vectorized
+    pass, so the variants share a single simulation.
+    """
+    merged = {}
+    for i, situation in enumerate(situations):
+        # Omitted group entities default to one unit spanning every person of
+        # the merged situation, so give each variant its own explicitly
+        people = list(situation["people"])
+        situation = {
+            **{entity: {entity: {"members": people}} for entity in GROUP_ENTITIES},
+            **situation,
+        }
+        for entity, instances in situation.items():
+            for name, data in instances.items():
+                if "members" in data:
+                    data = {**data, "members": [f"{m} {i}" for m in data["members"]]}
+                merged.setdefault(entity, {})[f"{name} {i}"] = data
+    return merged
+
+
+variants = [
+    ("Version 1: Age 35->36, no county", household_v1),
+    ("Version 2: Age stays 35, no county", household_v2),
+    ("Version 3: Age 35, with Essex County", household_v3),
+]
+
+sim = Simulation(
+    situation=merge_situations([hh for _, hh in variants]),
+    tax_benefit_system=tbs,
+)
+ptcs_2025 = sim.calculate("aca_ptc", map_to="household", period=2025)
+ptcs_2026 = sim.calculate("aca_ptc", map_to="household", period=2026)
+
+for i, (label, _) in enumerate(variants):
+    ptc_2025 = ptcs_2025[i]
+    ptc_2026 = ptcs_2026[i]
+    print(label)
+    print(f"  2025: ${ptc_2025:,.2f}")
+    print(f"  2026: ${ptc_2026:,.2f}")
+    print(f"  Difference: ${ptc_2025 - ptc_2026:,.2f}\n")
+
+# Check SLCSP differences - already computed on `sim` while deriving aca_ptc,
+# so these are cache hits rather than new simulations
 print("Checking SLCSP (benchmark plan costs):")
-for i, (name, hh) in enumerate([("v1", household_v1), ("v2", household_v2), ("v3", household_v3)]):
-    sim = Simulation(situation=hh)
-    slcsp_2025 = sim.calculate("slcsp", map_to="household", period=2025)[0]
-    slcsp_2026 = sim.calculate("slcsp", map_to="household", period=2026)[0]
-    print(f"  {name}: 2025=${slcsp_2025:,.2f}, 2026=${slcsp_2026:,.2f}")
+slcsps_2025 = sim.calculate("slcsp", map_to="household", period=2025)
+slcsps_2026 = sim.calculate("slcsp", map_to="household", period=2026)
+for i, name in enumerate(["v1", "v2", "v3"]):
+    print(f"  {name}: 2025=${slcsps_2025[i]:,.2f}, 2026=${slcsps_2026[i]:,.2f}")
 
 print("\nThe app said: 2025=$2,197, 2026=$933, Difference=$1,264")
 print("Our test said: 2025=$2,197.29, 2026=$969.85, Difference=$1,227.44")
\ No newline at end of file
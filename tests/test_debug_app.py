@@ -1,15 +1,10 @@
 """Debug Streamlit app to see what's rendering."""
-import sys
-sys.path.insert(0, '.')
 
-from streamlit.testing.v1 import AppTest
+from _helpers import run_app
 
 
-def debug_app():
-    """Debug what's in the app."""
-    at = AppTest.from_file("app.py")
-    at.run()
-
+def debug_app(at):
+    """Debug what's in an already-run app (see the `app_instance` fixture)."""
     print("=== APP STATE ===")
     print(f"Exception: {at.exception}")
     print(f"Main elements: {len(at.main)}")
@@ -29,4 +24,4 @@ def debug_app():
         print(at.exception)
 
 if __name__ == "__main__":
-    debug_app()
+    debug_app(run_app())
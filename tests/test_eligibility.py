@@ -1,61 +1,48 @@
 """Test ACA eligibility with different input methods."""
 import sys
-sys.path.insert(0, '.')
 
+import pytest
 from policyengine_us import Simulation
-from policyengine_core.reforms import Reform
 
-reform = Reform.from_dict({
+from _helpers import get_reform_tbs
+from _situations import couple
+
+REFORM_DICT = {
     "gov.aca.ptc_income_eligibility[2].amount": {"2026-01-01.2100-12-31": True}
-}, country_id="us")
-
-print("Testing 60yo couple at $85,000 income")
-
-# Test 1: Setting aca_magi directly
-print("\n=== Setting aca_magi directly ===")
-sit1 = {
-    'people': {'p1': {'age': {2026: 60}}, 'p2': {'age': {2026: 60}}},
-    'families': {'f1': {'members': ['p1', 'p2']}},
-    'marital_units': {'mu1': {'members': ['p1', 'p2']}},
-    'spm_units': {'spm1': {'members': ['p1', 'p2']}},
-    'tax_units': {'tu1': {'members': ['p1', 'p2'], 'aca_magi': {2026: 85000}}},
-    'households': {'h1': {'members': ['p1', 'p2'], 'state_name': {2026: 'WV'}}}
 }
 
-sim1 = Simulation(situation=sit1, reform=reform)
-eligible1 = sim1.calculate('is_aca_ptc_eligible', period=2026)
-filing1 = sim1.calculate('filing_status', period=2026)
-magi1 = sim1.calculate('aca_magi', period=2026)
-ptc1 = sim1.calculate('aca_ptc', period=2026)
-
-print(f"  Person 1 eligible: {eligible1[0]}")
-print(f"  Person 2 eligible: {eligible1[1]}")
-print(f"  Filing status: {filing1[0]}")
-print(f"  MAGI: ${magi1[0]:,.0f}")
-print(f"  PTC: ${ptc1[0]:,.0f}")
-
-# Test 2: Setting employment_income
-print("\n=== Setting employment_income ===")
-sit2 = {
-    'people': {
-        'p1': {'age': {2026: 60}, 'employment_income': {2026: 42500}},
-        'p2': {'age': {2026: 60}, 'employment_income': {2026: 42500}}
-    },
-    'families': {'f1': {'members': ['p1', 'p2']}},
-    'marital_units': {'mu1': {'members': ['p1', 'p2']}},
-    'spm_units': {'spm1': {'members': ['p1', 'p2']}},
-    'tax_units': {'tu1': {'members': ['p1', 'p2']}},
-    'households': {'h1': {'members': ['p1', 'p2'], 'state_name': {2026: 'WV'}}}
-}
 
-sim2 = Simulation(situation=sit2, reform=reform)
-eligible2 = sim2.calculate('is_aca_ptc_eligible', period=2026)
-filing2 = sim2.calculate('filing_status', period=2026)
-magi2 = sim2.calculate('aca_magi', period=2026)
-ptc2 = sim2.calculate('aca_ptc', period=2026)
-
-print(f"  Person 1 eligible: {eligible2[0]}")
-print(f"  Person 2 eligible: {eligible2[1]}")
-print(f"  Filing status: {filing2[0]}")
-print(f"  MAGI: ${magi2[0]:,.0f}")
-print(f"  PTC: ${ptc2[0]:,.0f}")
+@pytest.fixture(scope="module")
+def reform_tbs():
+    return get_reform_tbs(REFORM_DICT)
+
+
+@pytest.mark.parametrize(
+    "inputs",
+    [{"magi": 85000}, {"income": 85000}],
+    ids=["aca_magi", "employment_income"],
+)
+def test_eligibility_60yo_couple_85k(reform_tbs, inputs):
+    """60yo couple at $85,000, with MAGI set directly or from income."""
+    sim = Simulation(
+        situation=couple((60, 60), **inputs),
+        tax_benefit_system=reform_tbs,
+    )
+    # aca_ptc first: it computes the others as intermediates, so the
+    # remaining calls are cache hits
+    ptc = sim.calculate('aca_ptc', period=2026)
+    eligible = sim.calculate('is_aca_ptc_eligible', period=2026)
+    filing = sim.calculate('filing_status', period=2026)
+    magi = sim.calculate('aca_magi', period=2026)
+
+    print(f"  Person 1 eligible: {eligible[0]}")
+    print(f"  Person 2 eligible: {eligible[1]}")
+    print(f"  Filing status: {filing[0]}")
+    print(f"  MAGI: ${magi[0]:,.0f}")
+    print(f"  PTC: ${ptc[0]:,.0f}")
+
+    assert magi[0] == pytest.approx(85000)
+
+
+if __name__ == "__main__":
+    sys.exit(pytest.main([__file__, "-v", "-s"]))
@@ -1,29 +1,36 @@
 """Test that we can get FPL values from PolicyEngine instead of hardcoding"""
-from policyengine_us import Simulation
+import copy
 
+import pytest
+from policyengine_us import Simulation
 
-def test_get_fpl_from_policyengine():
-    """Test getting FPL values from PolicyEngine"""
-    # Test for household size of 4
-    situation = {
-        "people": {
-            "you": {"age": {2026: 35}},
-            "partner": {"age": {2026: 35}},
-            "child1": {"age": {2026: 10}},
-            "child2": {"age": {2026: 8}}
-        },
-        "families": {"your family": {"members": ["you", "partner", "child1", "child2"]}},
-        "spm_units": {"your household": {"members": ["you", "partner", "child1", "child2"]}},
-        "tax_units": {"your tax unit": {"members": ["you", "partner", "child1", "child2"]}},
-        "households": {
-            "your household": {
-                "members": ["you", "partner", "child1", "child2"],
-                "state_name": {2026: "TX"}
-            }
+from _helpers import get_tbs
+
+
+# Family of 4 in TX. Shared by tests - deepcopy before mutating.
+_BASE_FAMILY_TX = {
+    "people": {
+        "you": {"age": {2026: 35}},
+        "partner": {"age": {2026: 35}},
+        "child1": {"age": {2026: 10}},
+        "child2": {"age": {2026: 8}}
+    },
+    "families": {"your family": {"members": ["you", "partner", "child1", "child2"]}},
+    "spm_units": {"your household": {"members": ["you", "partner", "child1", "child2"]}},
+    "tax_units": {"your tax unit": {"members": ["you", "partner", "child1", "child2"]}},
+    "households": {
+        "your household": {
+            "members": ["you", "partner", "child1", "child2"],
+            "state_name": {2026: "TX"}
         }
     }
+}
 
-    sim = Simulation(situation=situation)
+
+def test_get_fpl_from_policyengine(tbs):
+    """Test getting FPL values from PolicyEngine"""
+    # Test for household size of 4
+    sim = Simulation(situation=_BASE_FAMILY_TX, tax_benefit_system=tbs)
 
     # Get FPL from PolicyEngine
     fpl = sim.calculate("tax_unit_fpg", period=2026)[0]
@@ -31,8 +38,9 @@ def test_get_fpl_from_policyengine():
 
     # Get ACA MAGI fraction
     # Set some income first
+    situation = copy.deepcopy(_BASE_FAMILY_TX)
     situation["people"]["you"]["employment_income"] = {2026: 50000}
-    sim = Simulation(situation=situation)
+    sim = Simulation(situation=situation, tax_benefit_system=tbs)
 
     fpl = sim.calculate("tax_unit_fpg", period=2026)[0]
     magi = sim.calculate("aca_magi", period=2026)[0]
@@ -49,46 +57,50 @@ def test_get_fpl_from_policyengine():
     assert magi > 0, "MAGI should be positive"
 
 
-def test_compare_hardcoded_vs_policyengine_fpl():
-    """Compare our hardcoded FPL values to PolicyEngine"""
-    # Hardcoded values from app.py
-    fpl_hardcoded = {
-        1: 15570,
-        2: 21130,
-        3: 26650,
-        4: 32200,
-        5: 37750,
-        6: 43300,
-        7: 48850,
-        8: 54400,
-    }
+# Hardcoded values from app.py
+FPL_HARDCODED = {
+    1: 15570,
+    2: 21130,
+    3: 26650,
+    4: 32200,
+    5: 37750,
+    6: 43300,
+    7: 48850,
+    8: 54400,
+}
 
-    for size in range(1, 9):
-        situation = {
-            "people": {f"person{i}": {"age": {2026: 30}} for i in range(size)},
-            "families": {"fam": {"members": [f"person{i}" for i in range(size)]}},
-            "spm_units": {"spm": {"members": [f"person{i}" for i in range(size)]}},
-            "tax_units": {"tu": {"members": [f"person{i}" for i in range(size)]}},
-            "households": {
-                "hh": {
-                    "members": [f"person{i}" for i in range(size)],
-                    "state_name": {2026: "TX"}
-                }
+
+@pytest.mark.parametrize("size", sorted(FPL_HARDCODED))
+def test_compare_hardcoded_vs_policyengine_fpl(tbs, size):
+    """Compare our hardcoded FPL values to PolicyEngine"""
+    members = [f"person{i}" for i in range(size)]
+    situation = {
+        "people": {m: {"age": {2026: 30}} for m in members},
+        "families": {"fam": {"members": members}},
+        "spm_units": {"spm": {"members": members}},
+        "tax_units": {"tu": {"members": members}},
+        "households": {
+            "hh": {
+                "members": members,
+                "state_name": {2026: "TX"}
             }
         }
+    }
 
-        sim = Simulation(situation=situation)
-        fpl_pe = sim.calculate("tax_unit_fpg", period=2026)[0]
-        fpl_hard = fpl_hardcoded[size]
+    sim = Simulation(situation=situation, tax_benefit_system=tbs)
+    fpl_pe = sim.calculate("tax_unit_fpg", period=2026)[0]
+    fpl_hard = FPL_HARDCODED[size]
 
-        print(f"\nSize {size}: Hardcoded=${fpl_hard:,} PolicyEngine=${fpl_pe:,.0f} Diff=${(fpl_pe - fpl_hard):,.0f}")
+    print(f"\nSize {size}: Hardcoded=${fpl_hard:,} PolicyEngine=${fpl_pe:,.0f} Diff=${(fpl_pe - fpl_hard):,.0f}")
 
-        # They should be close (might differ by year)
-        # Let's just check they're in the same ballpark (within 20%)
-        assert abs(fpl_pe - fpl_hard) / fpl_hard < 0.2, f"FPL values differ too much for size {size}"
+    # They should be close (might differ by year)
+    # Let's just check they're in the same ballpark (within 20%)
+    assert abs(fpl_pe - fpl_hard) / fpl_hard < 0.2, f"FPL values differ too much for size {size}"
 
 
 if __name__ == "__main__":
-    test_get_fpl_from_policyengine()
+    tbs = get_tbs()
+    test_get_fpl_from_policyengine(tbs)
     print("\n" + "="*80)
-    test_compare_hardcoded_vs_policyengine_fpl()
+    for size in sorted(FPL_HARDCODED):
+        test_compare_hardcoded_vs_policyengine_fpl(tbs, size)
@@ -5,8 +5,34 @@ import pytest
 from policyengine_us import Simulation
 import numpy as np
 
+from _situations import income_grid
+from aca_calc.calculations.household import build_household_situation
 
-def test_understand_axes_behavior():
+
+# Exact $1k steps from $0 to $1M, as integers so every value is exact
+INCOMES_1K = np.arange(0, 1_000_001, 1000, dtype=np.int64)
+
+
+def assert_exact_1k_steps(income_range):
+    """Assert income_range[i] is within $1 of i * 1000 for every i."""
+    expected = np.arange(len(income_range), dtype=np.int64) * 1000
+    err = np.abs(income_range - expected)
+    max_err = float(err.max())
+
+    # Only build the per-index report when something is off by more than $1
+    if max_err > 1:
+        bad_idx = np.flatnonzero(err > 1)
+        print(f"\nFound {bad_idx.size} values with >$1 error (first 10):")
+        for i in bad_idx[:10]:
+            print(f"  Index {i}: expected ${expected[i]:,.0f}, got ${income_range[i]:,.2f}, error ${err[i]:,.2f}")
+    else:
+        print(f"\n✓ All {len(income_range)} values are within $1 of exact 1k increments!")
+
+    assert max_err <= 1, f"Max error ${max_err:,.2f} exceeds $1"
+
+
+@pytest.mark.debug
+def test_understand_axes_behavior(tbs):
     """Understand how PolicyEngine axes work"""
     # Test with small count to understand pattern
     situation = {
@@ -32,7 +58,7 @@ def test_understand_axes_behavior():
         ]
     }
 
-    sim = Simulation(situation=situation)
+    sim = Simulation(situation=situation, tax_benefit_system=tbs)
     income_range = sim.calculate("employment_income", map_to="household", period=2026)
 
     print(f"\nWith count=11, min=0, max=100000:")
@@ -42,12 +68,12 @@ def test_understand_axes_behavior():
     print(f"Last value: {income_range[-1]}")
 
     # Check if it's exponential/logarithmic
-    import numpy as np
     print(f"\nExpected linspace: {np.linspace(0, 100000, 11)}")
     print(f"\nExpected logspace (excluding 0): {np.logspace(0, 5, 11)}")
 
 
-def test_axes_with_adjusted_max():
+@pytest.mark.debug
+def test_axes_with_adjusted_max(tbs):
     """Test with adjusted max to account for PolicyEngine's overshoot"""
     # PolicyEngine overshoots by ratio of ~1.09689
     # To get max of 1,000,000, use: 1,000,000 / 1.09689 = 911,570
@@ -76,7 +102,7 @@ def test_axes_with_adjusted_max():
         ]
     }
 
-    sim = Simulation(situation=situation)
+    sim = Simulation(situation=situation, tax_benefit_system=tbs)
     income_range = sim.calculate("employment_income", map_to="household", period=2026)
 
     print(f"\nWith count=1001, min=0, max={adjusted_max} (adjusted):")
@@ -85,7 +111,6 @@ def test_axes_with_adjusted_max():
     print(f"Actual last value: {income_range[-1]}")
 
     # Check if values are close to exact thousands
-    import numpy as np
     errors = []
     for i in range(len(income_range)):
         expected = i * 1000
@@ -100,141 +125,70 @@ def test_axes_with_adjusted_max():
             print(f"  Index {i}: expected ${exp:,.0f}, got ${act:,.2f}, error ${err:,.2f}")
 
 
-def test_axes_generates_exact_1k_increments():
-    """Test using numpy arange directly to create exact 1k increments
+@pytest.mark.debug
+def test_explicit_incomes_give_exact_1k_increments(tbs):
+    """Test setting an exact 1k income grid directly, without axes
 
-    Since PolicyEngine axes don't generate exact increments, we may need
-    to manually construct the income array or find the right "step" parameter.
+    The income array is constructed with numpy and set on one household
+    per value, as an alternative to the chart's axis.
     """
     # First, let's verify that numpy arange/linspace can do what we want
-    import numpy as np
-    expected_incomes = np.arange(0, 1000001, 1000)  # 0, 1000, 2000, ..., 1000000
+    expected_incomes = INCOMES_1K  # 0, 1000, 2000, ..., 1000000
 
     print(f"\nNumPy arange(0, 1000001, 1000):")
     print(f"Length: {len(expected_incomes)}")
     print(f"First 10: {expected_incomes[:10]}")
     print(f"Last 10: {expected_incomes[-10:]}")
-    print(f"All are exact multiples of 1000: {all(x % 1000 == 0 for x in expected_incomes)}")
-
-    # Check if axes supports "step" parameter
-    try:
-        situation = {
-            "people": {"you": {"age": {2026: 35}}},
-            "families": {"your family": {"members": ["you"]}},
-            "spm_units": {"your household": {"members": ["you"]}},
-            "tax_units": {"your tax unit": {"members": ["you"]}},
-            "households": {
-                "your household": {
-                    "members": ["you"],
-                    "state_name": {2026: "TX"}
-                }
-            },
-            "axes": [
-                [
-                    {
-                        "name": "employment_income",
-                        "min": 0,
-                        "max": 1000000,
-                        "step": 1000  # Try step parameter
-                    }
-                ]
-            ]
-        }
-
-        sim = Simulation(situation=situation)
-        income_range = sim.calculate("employment_income", map_to="household", period=2026)
+    print(f"All are exact multiples of 1000: {(expected_incomes % 1000 == 0).all()}")
+
+    # Set the incomes explicitly rather than through axes, which only
+    # support count/min/max and drift under uprating
+    sim = Simulation(
+        situation=income_grid(expected_incomes),
+        tax_benefit_system=tbs,
+    )
+    income_range = sim.calculate("employment_income", map_to="household", period=2026)
 
-        print(f"\nWith step=1000 parameter:")
-        print(f"Length: {len(income_range)}")
-        print(f"First 10: {income_range[:10]}")
-        print(f"Last 10: {income_range[-10:]}")
+    print(f"\nWith explicit 2026 incomes:")
+    print(f"Length: {len(income_range)}")
+    print(f"First 10: {income_range[:10]}")
+    print(f"Last 10: {income_range[-10:]}")
 
-        # Check if all values are exact multiples of 1000
-        all_exact = all(abs(x - round(x / 1000) * 1000) < 0.01 for x in income_range)
-        print(f"All are exact multiples of 1000: {all_exact}")
+    # Check if all values are exact multiples of 1000
+    all_exact = np.all(np.abs(income_range - np.round(income_range / 1000) * 1000) < 0.01)
+    print(f"All are exact multiples of 1000: {all_exact}")
 
-    except Exception as e:
-        print(f"\nStep parameter not supported: {e}")
+    assert all_exact, "Explicit incomes should come back as exact 1k steps"
 
 
-def test_get_uprating_factor():
+@pytest.mark.debug
+def test_get_uprating_factor(tbs):
     """Find the uprating factor for employment_income in 2026"""
-    from policyengine_us import Simulation
-
-    # Create simulation and get the uprating parameter
-    sim = Simulation(situation={
-        "people": {"you": {}},
-        "households": {"your household": {"members": ["you"]}}
-    })
-
-    # Get the uprating factor
+    # Read the parameter straight off the shared tax-benefit system; no
+    # Simulation is needed
     try:
-        uprating_param = sim.tax_benefit_system.parameters.calibration.gov.irs.soi.employment_income
+        uprating_param = tbs.parameters.calibration.gov.irs.soi.employment_income
         uprating_2026 = uprating_param("2026-01-01")
-        print(f"\nUprating factor for 2026: {uprating_2026}")
-        print(f"To get actual max of 1M, use specified max of: {1000000 / uprating_2026:,.0f}")
-        return uprating_2026
     except Exception as e:
-        print(f"\nCouldn't get uprating factor: {e}")
-        # Calculate it empirically
-        situation = {
-            "people": {"you": {"age": {2026: 35}}},
-            "families": {"your family": {"members": ["you"]}},
-            "spm_units": {"your household": {"members": ["you"]}},
-            "tax_units": {"your tax unit": {"members": ["you"]}},
-            "households": {
-                "your household": {
-                    "members": ["you"],
-                    "state_name": {2026: "TX"}
-                }
-            },
-            "axes": [
-                [
-                    {
-                        "name": "employment_income",
-                        "count": 2,
-                        "min": 0,
-                        "max": 100000
-                    }
-                ]
-            ]
-        }
+        pytest.skip(f"Couldn't get uprating factor: {e}")
 
-        sim = Simulation(situation=situation)
-        income = sim.calculate("employment_income", map_to="household", period=2026)
-        uprating = income[-1] / 100000
-        print(f"\nEmpirical uprating factor: {uprating}")
-        print(f"To get actual max of 1M, use specified max of: {1000000 / uprating:,.0f}")
-        return uprating
+    print(f"\nUprating factor for 2026: {uprating_2026}")
+    print(f"To get actual max of 1M, use specified max of: {1000000 / uprating_2026:,.0f}")
 
 
-def test_axes_with_period_2026():
-    """Test using period: 2026 in axes to avoid uprating"""
-    situation = {
-        "people": {"you": {"age": {2026: 35}}},
-        "families": {"your family": {"members": ["you"]}},
-        "spm_units": {"your household": {"members": ["you"]}},
-        "tax_units": {"your tax unit": {"members": ["you"]}},
-        "households": {
-            "your household": {
-                "members": ["you"],
-                "state_name": {2026: "TX"}
-            }
-        },
-        "axes": [
-            [
-                {
-                    "name": "employment_income",
-                    "count": 1001,
-                    "min": 0,
-                    "max": 1000000,
-                    "period": 2026  # Specify period to avoid uprating
-                }
-            ]
-        ]
-    }
+def test_axes_with_period_2026(tbs):
+    """Test the chart's axis (period: 2026 in axes) gives exact 1k steps"""
+    # The same situation the app sweeps for its charts
+    situation = build_household_situation(
+        age_head=35,
+        age_spouse=None,
+        dependent_ages=[],
+        state="TX",
+        year=2026,
+        with_axes=True,
+    )
 
-    sim = Simulation(situation=situation)
+    sim = Simulation(situation=situation, tax_benefit_system=tbs)
     income_range = sim.calculate("employment_income", map_to="household", period=2026)
 
     print(f"\nWith period=2026 in axes config:")
@@ -242,26 +196,10 @@ def test_axes_with_period_2026():
     print(f"Last 10 values: {income_range[-10:]}")
     print(f"Actual last value: {income_range[-1]:,.2f}")
 
-    # Check if values are exact thousands
-    errors = []
-    for i in range(len(income_range)):
-        expected = i * 1000
-        actual = income_range[i]
-        error = abs(actual - expected)
-        if error > 1:  # More than $1 error
-            errors.append((i, expected, actual, error))
-
-    if errors:
-        print(f"\nFound {len(errors)} values with >$1 error (first 10):")
-        for i, exp, act, err in errors[:10]:
-            print(f"  Index {i}: expected ${exp:,.0f}, got ${act:,.2f}, error ${err:,.2f}")
-    else:
-        print(f"\n✓ All {len(income_range)} values are exact 1k increments!")
-
-    assert len(errors) == 0, f"Found {len(errors)} values with errors > $1"
+    assert_exact_1k_steps(income_range)
 
 
-def test_axes_with_uprating_compensation():
+def test_axes_with_uprating_compensation(tbs):
     """Test using compensated max to account for uprating"""
     # Use empirical uprating factor of ~1.09689
     # (The parameter lookup doesn't give us a simple multiplier)
@@ -293,7 +231,7 @@ def test_axes_with_uprating_compensation():
         ]
     }
 
-    sim = Simulation(situation=situation)
+    sim = Simulation(situation=situation, tax_benefit_system=tbs)
     income_range = sim.calculate("employment_income", map_to="household", period=2026)
 
     print(f"\nWith compensated max={compensated_max:,.0f}:")
@@ -301,20 +239,4 @@ def test_axes_with_uprating_compensation():
     print(f"Last 10 values: {income_range[-10:]}")
     print(f"Actual last value: {income_range[-1]:,.2f}")
 
-    # Check if values are close to exact thousands
-    errors = []
-    for i in range(len(income_range)):
-        expected = i * 1000
-        actual = income_range[i]
-        error = abs(actual - expected)
-        if error > 1:  # More than $1 error
-            errors.append((i, expected, actual, error))
-
-    if errors:
-        print(f"\nFound {len(errors)} values with >$1 error (first 10):")
-        for i, exp, act, err in errors[:10]:
-            print(f"  Index {i}: expected ${exp:,.0f}, got ${act:,.2f}, error ${err:,.2f}")
-    else:
-        print(f"\n✓ All {len(income_range)} values are within $1 of exact 1k increments!")
-
-    assert len(errors) == 0, f"Found {len(errors)} values with errors > $1"
+    assert_exact_1k_steps(income_range)
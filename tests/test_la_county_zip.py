@@ -9,11 +9,11 @@ import pytest
 from policyengine_us import Simulation
 
 
-def test_la_county_requires_zip_code():
-    """LA County should work with a valid zip code"""
-    situation = {
+def _la_situation(zip_code, income):
+    """Single 30-year-old in LA County at the given zip code."""
+    return {
         "people": {
-            "you": {"age": {2026: 30}, "employment_income": {2026: 50000}}
+            "you": {"age": {2026: 30}, "employment_income": {2026: income}}
         },
         "families": {"your family": {"members": ["you"]}},
         "spm_units": {"your household": {"members": ["you"]}},
@@ -23,12 +23,22 @@ def test_la_county_requires_zip_code():
                 "members": ["you"],
                 "state_name": {2026: "CA"},
                 "county": {2026: "LOS_ANGELES_COUNTY_CA"},
-                "zip_code": {2026: "90001"},  # South LA zip code
+                "zip_code": {2026: zip_code},
             }
         },
     }
 
-    sim = Simulation(situation=situation)
+
+@pytest.mark.parametrize(
+    "zip_code, income",
+    [("90012", 40000), ("90401", 40000), ("90001", 50000)],
+    ids=["downtown_la", "santa_monica", "south_la"],
+)
+def test_la_county_slcsp_with_zip_code(tbs, zip_code, income):
+    """LA County should work with a valid zip code"""
+    sim = Simulation(
+        situation=_la_situation(zip_code, income), tax_benefit_system=tbs
+    )
 
     # Should be able to calculate SLCSP without error
     slcsp = sim.calculate("slcsp", map_to="household", period=2026)[0]
@@ -39,60 +49,11 @@ def test_la_county_requires_zip_code():
     # PTC may or may not be positive depending on SLCSP and income, but should not error
     assert ptc >= 0
 
-
-def test_la_county_different_zip_codes():
-    """Different LA County zip codes should potentially have different SLCSPs"""
-    # Downtown LA
-    situation_downtown = {
-        "people": {
-            "you": {"age": {2026: 30}, "employment_income": {2026: 40000}}
-        },
-        "families": {"your family": {"members": ["you"]}},
-        "spm_units": {"your household": {"members": ["you"]}},
-        "tax_units": {"your tax unit": {"members": ["you"]}},
-        "households": {
-            "your household": {
-                "members": ["you"],
-                "state_name": {2026: "CA"},
-                "county": {2026: "LOS_ANGELES_COUNTY_CA"},
-                "zip_code": {2026: "90012"},  # Downtown LA
-            }
-        },
-    }
-
-    # Santa Monica
-    situation_santa_monica = {
-        "people": {
-            "you": {"age": {2026: 30}, "employment_income": {2026: 40000}}
-        },
-        "families": {"your family": {"members": ["you"]}},
-        "spm_units": {"your household": {"members": ["you"]}},
-        "tax_units": {"your tax unit": {"members": ["you"]}},
-        "households": {
-            "your household": {
-                "members": ["you"],
-                "state_name": {2026: "CA"},
-                "county": {2026: "LOS_ANGELES_COUNTY_CA"},
-                "zip_code": {2026: "90401"},  # Santa Monica
-            }
-        },
-    }
-
-    sim1 = Simulation(situation=situation_downtown)
-    sim2 = Simulation(situation=situation_santa_monica)
-
-    slcsp1 = sim1.calculate("slcsp", map_to="household", period=2026)[0]
-    slcsp2 = sim2.calculate("slcsp", map_to="household", period=2026)[0]
-
-    # Both should calculate successfully
-    assert slcsp1 > 0
-    assert slcsp2 > 0
-
-    # They might be different (depending on rating areas) but at least they should both work
-    # Note: We're not asserting they're different because they might be in the same rating area
+    # Zip codes might map to different rating areas, so SLCSPs are not
+    # compared across cases - each just has to resolve
 
 
-def test_other_california_counties_work_without_zip():
+def test_other_california_counties_work_without_zip(tbs):
     """Other CA counties should work without zip code"""
     situation = {
         "people": {
@@ -111,6 +72,6 @@ def test_other_california_counties_work_without_zip():
         },
     }
 
-    sim = Simulation(situation=situation)
+    sim = Simulation(situation=situation, tax_benefit_system=tbs)
     slcsp = sim.calculate("slcsp", map_to="household", period=2026)[0]
     assert slcsp > 0, "Non-LA CA counties should work without zip code"
@@ -1,6 +1,8 @@
 from policyengine_us import Simulation
 from policyengine_core.reforms import Reform
 
+from _situations import with_income
+
 # Test household at 300% FPL (should get credits in both scenarios)
 household = {
     'people': {'you': {'age': {2026: 30}, 'employment_income': {2026: 31650}}},
@@ -34,8 +36,7 @@ print(f'  After expiration (original ACA): ${ptc_reform:,.2f}')
 print(f'  Person LOSES: ${ptc_baseline - ptc_reform:,.2f} when IRA expires')
 
 # Test at 450% FPL (above the cliff)
-household_450 = household.copy()
-household_450['people']['you']['employment_income'] = {2026: 70000}
+household_450 = with_income(household, 70000)
 
 sim_450_base = Simulation(situation=household_450)
 sim_450_reform = Simulation(situation=household_450, reform=reform)
@@ -3,42 +3,39 @@ import pytest
 import numpy as np
 from policyengine_us import Simulation
 
+from _situations import income_grid
 
-def test_mtr_positive_for_typical_household():
-    """MTR should be positive for most income levels"""
-    situation = {
-        "people": {"you": {"age": {2026: 60}}},
-        "families": {"family": {"members": ["you"]}},
-        "spm_units": {"household": {"members": ["you"]}},
-        "tax_units": {"tax_unit": {"members": ["you"]}},
-        "marital_units": {"marital_unit": {"members": ["you"]}},
-        "households": {
-            "household": {
-                "members": ["you"],
-                "state_name": {2026: "AK"},
-            }
-        },
-        "axes": [[{"name": "employment_income", "count": 101, "min": 0, "max": 100000, "period": 2026}]]
-    }
-
-    sim = Simulation(situation=situation)
-    
-    income = sim.calculate("employment_income", map_to="household", period=2026)
-    net_income = sim.calculate("household_net_income_including_health_benefits", map_to="household", period=2026)
-    
-    # Calculate MTR at income=$50k (index 50)
+
+# $0 to $100k in exact $1k steps
+INCOMES = np.linspace(0, 100_000, 101).astype(np.int64)
+
+
+def mtr_at_50k(net_income, incomes):
+    """MTR at $50k on a $1k-step grid, from the change between $40k and $60k."""
     i = 50
     window = 10
-    d_income = income[i+window] - income[i-window]
+    d_income = incomes[i+window] - incomes[i-window]
     d_net = net_income[i+window] - net_income[i-window]
-    mtr = 1 - d_net / d_income
-    
+    return 1 - d_net / d_income
+
+
+def test_mtr_positive_for_typical_household(tbs):
+    """MTR should be positive for most income levels"""
+    # One household per income, set directly for 2026 so axes uprating
+    # cannot skew the grid
+    situation = income_grid(INCOMES, ages=(60,), state="AK")
+
+    sim = Simulation(situation=situation, tax_benefit_system=tbs)
+
+    net_income = sim.calculate("household_net_income_including_health_benefits", map_to="household", period=2026)
+    mtr = mtr_at_50k(net_income, INCOMES)
+
     # MTR should be positive (between 0 and 100%)
     assert mtr > 0, f"MTR is negative: {mtr*100:.1f}%"
     assert mtr < 1, f"MTR exceeds 100%: {mtr*100:.1f}%"
-    
+
     print(f"MTR at $50k income: {mtr*100:.1f}%")
-    
+
 
 def test_mtr_formula():
     """Verify MTR formula: MTR = 1 - d(net)/d(gross)"""
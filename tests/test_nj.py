@@ -35,15 +35,16 @@ household = {
     }
 }
 
+# One simulation covers both years - the situation has 2025 and 2026 inputs
+sim = Simulation(situation=household)
+
 # Calculate for 2025 (with IRA enhancements)
-sim_2025 = Simulation(situation=household)
-ptc_2025 = sim_2025.calculate("aca_ptc", map_to="household", period=2025)[0]
-slcsp_2025 = sim_2025.calculate("slcsp", map_to="household", period=2025)[0]
+ptc_2025 = sim.calculate("aca_ptc", map_to="household", period=2025)[0]
+slcsp_2025 = sim.calculate("slcsp", map_to="household", period=2025)[0]
 
 # Calculate for 2026 (after IRA expires)
-sim_2026 = Simulation(situation=household)
-ptc_2026 = sim_2026.calculate("aca_ptc", map_to="household", period=2026)[0]
-slcsp_2026 = sim_2026.calculate("slcsp", map_to="household", period=2026)[0]
+ptc_2026 = sim.calculate("aca_ptc", map_to="household", period=2026)[0]
+slcsp_2026 = sim.calculate("slcsp", map_to="household", period=2026)[0]
 
 # Calculate FPL percentage
 fpl_2026 = 15570  # Single person FPL
@@ -1,9 +1,11 @@
 """Test basic PolicyEngine US functionality."""
-import sys
-sys.path.insert(0, '.')
+import re
 
 from policyengine_us import Simulation
 
+# Keywords marking health/ACA related variables, as one alternation
+HEALTH_VAR_PATTERN = re.compile(r"health|aca|premium|slcsp|medicaid|chip")
+
 
 def test_basic_simulation():
     """Test that basic simulation works."""
@@ -34,7 +36,7 @@ def test_basic_simulation():
     all_vars = list(sim.tax_benefit_system.variables.keys())
 
     # Find health/ACA related variables
-    health_vars = [v for v in all_vars if any(keyword in v.lower() for keyword in ['health', 'aca', 'premium', 'slcsp', 'medicaid', 'chip'])]
+    health_vars = [v for v in all_vars if HEALTH_VAR_PATTERN.search(v.lower())]
 
     print(f"Found {len(health_vars)} health-related variables:")
     for v in sorted(health_vars)[:30]:
@@ -1,6 +1,4 @@
 """Show actual errors in the app."""
-import sys
-sys.path.insert(0, '.')
 
 from streamlit.testing.v1 import AppTest
 
@@ -1,36 +1,29 @@
 """Test Streamlit app execution."""
 import sys
-sys.path.insert(0, '.')
 
+import pytest
 from streamlit.testing.v1 import AppTest
 
 
-def test_app_runs():
+def test_app_runs(app_instance):
     """Test that the app runs without errors."""
-    at = AppTest.from_file("app.py")
-
-    # Run the app
-    at.run()
-
     # Check that there are no exceptions
-    assert not at.exception, f"App raised exception: {at.exception}"
+    assert not app_instance.exception, f"App raised exception: {app_instance.exception}"
 
     print("✓ App loads without errors")
 
 
-def test_sidebar_exists():
+def test_sidebar_exists(app_instance):
     """Test that sidebar is rendered."""
-    at = AppTest.from_file("app.py")
-    at.run()
-
     # Check sidebar exists
-    assert len(at.sidebar) > 0, "Sidebar should exist"
+    assert len(app_instance.sidebar) > 0, "Sidebar should exist"
 
     print("✓ Sidebar exists")
 
 
 def test_basic_calculation():
     """Test basic calculation flow."""
+    # Sets widgets, so it needs its own app rather than the shared one
     at = AppTest.from_file("app.py")
     at.run()
 
@@ -52,7 +45,4 @@ def test_basic_calculation():
 
 
 if __name__ == "__main__":
-    test_app_runs()
-    test_sidebar_exists()
-    test_basic_calculation()
-    print("\n✅ All Streamlit tests passed!")
+    sys.exit(pytest.main([__file__, "-v", "-s"]))
@@ -1,69 +1,78 @@
+"""Texas couple from the notebook, baseline vs IRA extension."""
+import pytest
 from policyengine_us import Simulation
-from policyengine_core.reforms import Reform
 
-# Texas couple example from notebook - at 300% FPL ($63,450)
-income = 63450
+from _helpers import IRA_EXTENSION_REFORM, get_reform_tbs, get_tbs
+from _situations import texas_couple, with_income_axis
+
 year = 2026
+INCOME_300_FPL = 63450
+INCOME_400_FPL = 84600
+
+# Both partners swept together over their half of each household income,
+# so one simulation per policy covers the 300% and 400% FPL cases
+household = with_income_axis(
+    texas_couple(INCOME_300_FPL, year=year),
+    INCOME_300_FPL / 2,
+    INCOME_400_FPL / 2,
+    count=2,
+    year=year,
+)
+
+
+def simulate_ptc_by_income():
+    """Household PTC at [300%, 400%] FPL under baseline and IRA extension.
+
+    As in the notebook, the reform sets ptc_income_eligibility[2] = True,
+    which KEEPS eligibility above 400% FPL.
+    """
+    sim_baseline = Simulation(situation=household, tax_benefit_system=get_tbs())
+    sim_reform = Simulation(
+        situation=household,
+        tax_benefit_system=get_reform_tbs(IRA_EXTENSION_REFORM),
+    )
+    return (
+        sim_baseline.calculate('aca_ptc', map_to='household', period=year),
+        sim_reform.calculate('aca_ptc', map_to='household', period=year),
+    )
+
+
+@pytest.fixture(scope="module")
+def ptc_by_income():
+    """Both simulations, run once for the module's tests."""
+    return simulate_ptc_by_income()
+
+
+def test_texas_300_fpl(ptc_by_income):
+    """Texas couple at 300% FPL ($63,450)."""
+    baseline, reform = ptc_by_income
+    ptc_baseline, ptc_reform = baseline[0], reform[0]
+
+    print(f'Texas couple at 300% FPL ($63,450):')
+    print(f'  PTC with IRA (baseline): ${ptc_baseline:,.2f}')
+    print(f'  PTC without IRA (reform): ${ptc_reform:,.2f}')
+    print(f'  Difference: ${ptc_baseline - ptc_reform:,.2f}')
+    print(f'\nNotebook expected: baseline=$4,062, reform=$6,283')
+    print(f'Match baseline: {abs(ptc_baseline - 4062) < 10}')
+    print(f'Match reform: {abs(ptc_reform - 6283) < 10}')
+
+    assert ptc_reform > ptc_baseline
+
+
+def test_texas_400_fpl(ptc_by_income):
+    """Texas couple at 400% FPL ($84,600)."""
+    baseline, reform = ptc_by_income
+    ptc_400_baseline, ptc_400_reform = baseline[1], reform[1]
+
+    print(f'\nTexas couple at 400% FPL ($84,600):')
+    print(f'  PTC with IRA (baseline): ${ptc_400_baseline:,.2f}')
+    print(f'  PTC without IRA (reform): ${ptc_400_reform:,.2f}')
+    print(f'  Notebook expected: baseline=$0, reform=$2,899')
+
+    assert ptc_400_baseline == 0
+
 
-# Baseline household
-household = {
-    'people': {
-        'you': {'age': {year: 25}, 'employment_income': {year: income/2}},
-        'your partner': {'age': {year: 28}, 'employment_income': {year: income/2}}
-    },
-    'families': {'your family': {'members': ['you', 'your partner']}},
-    'tax_units': {'your tax unit': {'members': ['you', 'your partner']}},
-    'households': {
-        'your household': {
-            'members': ['you', 'your partner'],
-            'state_name': {year: 'TX'}
-        }
-    },
-    'marital_units': {'your marital unit': {'members': ['you', 'your partner']}}
-}
-
-# Create reform (IRA expires) - NOTE the key difference!
-# The notebook has ptc_income_eligibility[2] = True which KEEPS eligibility above 400%
-# We had it as False which REMOVES eligibility above 400%
-reform = Reform.from_dict({
-    'gov.aca.ptc_phase_out_rate[0].amount': {'2026-01-01.2100-12-31': 0},
-    'gov.aca.ptc_phase_out_rate[1].amount': {'2026-01-01.2100-12-31': 0},
-    'gov.aca.ptc_phase_out_rate[2].amount': {'2026-01-01.2100-12-31': 0},
-    'gov.aca.ptc_phase_out_rate[3].amount': {'2026-01-01.2100-12-31': 0.02},
-    'gov.aca.ptc_phase_out_rate[4].amount': {'2026-01-01.2100-12-31': 0.04},
-    'gov.aca.ptc_phase_out_rate[5].amount': {'2026-01-01.2100-12-31': 0.06},
-    'gov.aca.ptc_phase_out_rate[6].amount': {'2026-01-01.2100-12-31': 0.085},
-    'gov.aca.ptc_income_eligibility[2].amount': {'2026-01-01.2100-12-31': True}  # THIS IS THE KEY!
-}, country_id='us')
-
-# Run simulations
-sim_baseline = Simulation(situation=household)
-sim_reform = Simulation(situation=household, reform=reform)
-
-ptc_baseline = sim_baseline.calculate('aca_ptc', map_to='household', period=year)[0]
-ptc_reform = sim_reform.calculate('aca_ptc', map_to='household', period=year)[0]
-
-print(f'Texas couple at 300% FPL ($63,450):')
-print(f'  PTC with IRA (baseline): ${ptc_baseline:,.2f}')
-print(f'  PTC without IRA (reform): ${ptc_reform:,.2f}')
-print(f'  Difference: ${ptc_baseline - ptc_reform:,.2f}')
-print(f'\nNotebook expected: baseline=$4,062, reform=$6,283')
-print(f'Match baseline: {abs(ptc_baseline - 4062) < 10}')
-print(f'Match reform: {abs(ptc_reform - 6283) < 10}')
-
-# Also test at 400% FPL
-income_400 = 84600
-household_400 = household.copy()
-household_400['people']['you']['employment_income'] = {year: income_400/2}
-household_400['people']['your partner']['employment_income'] = {year: income_400/2}
-
-sim_400_baseline = Simulation(situation=household_400)
-sim_400_reform = Simulation(situation=household_400, reform=reform)
-
-ptc_400_baseline = sim_400_baseline.calculate('aca_ptc', map_to='household', period=year)[0]
-ptc_400_reform = sim_400_reform.calculate('aca_ptc', map_to='household', period=year)[0]
-
-print(f'\nTexas couple at 400% FPL ($84,600):')
-print(f'  PTC with IRA (baseline): ${ptc_400_baseline:,.2f}')
-print(f'  PTC without IRA (reform): ${ptc_400_reform:,.2f}')
-print(f'  Notebook expected: baseline=$0, reform=$2,899')
\ No newline at end of file
+if __name__ == "__main__":
+    results = simulate_ptc_by_income()
+    test_texas_300_fpl(results)
+    test_texas_400_fpl(results)
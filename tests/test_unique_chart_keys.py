@@ -1,42 +1,73 @@
 """Test that all plotly_chart elements have unique keys."""
 
-import re
+import ast
+import functools
+import os
+
+
+class _ChartVisitor(ast.NodeVisitor):
+    """Collect key= arguments of st.plotly_chart calls, in source order."""
+
+    def __init__(self):
+        self.n_charts = 0
+        self.missing_keys = []
+        self.seen = set()
+        self.dups = set()
+
+    def visit_Call(self, node):
+        func = node.func
+        if (
+            isinstance(func, ast.Attribute)
+            and func.attr == "plotly_chart"
+            and isinstance(func.value, ast.Name)
+            and func.value.id == "st"
+        ):
+            self.n_charts += 1
+            key = next((kw.value for kw in node.keywords if kw.arg == "key"), None)
+            if key is None:
+                self.missing_keys.append(self.n_charts)
+            elif isinstance(key, ast.Constant):
+                # Computed keys (f-strings, names) can't be compared statically
+                (self.dups if key.value in self.seen else self.seen).add(key.value)
+        self.generic_visit(node)
+
+
+@functools.lru_cache(maxsize=8)
+def _scan(path, mtime_ns, size):
+    """Chart count, 1-based indices of keyless charts and repeated keys.
+
+    `mtime_ns` and `size` only key the cache, so an edited file is rescanned.
+    """
+    with open(path, "rb") as f:
+        source = f.read()
+    # Skip parsing when no chart call can be present; checking the bare
+    # attribute name also catches spacing like `st .plotly_chart`
+    if b"plotly_chart" not in source:
+        return 0, (), frozenset()
+
+    visitor = _ChartVisitor()
+    visitor.visit(ast.parse(source, filename=path))
+    return visitor.n_charts, tuple(visitor.missing_keys), frozenset(visitor.dups)
 
 
 def test_all_plotly_charts_have_unique_keys():
     """Verify all st.plotly_chart calls have unique key parameters."""
-    with open("app.py", "r") as f:
-        content = f.read()
-
-    # Find all st.plotly_chart calls
-    # Pattern matches: st.plotly_chart(...) including multiline
-    pattern = r'st\.plotly_chart\([^)]+(?:\n[^)]+)*\)'
-    matches = re.findall(pattern, content)
-
-    print(f"\nFound {len(matches)} st.plotly_chart calls")
-
-    keys = []
-    missing_keys = []
-
-    for i, match in enumerate(matches):
-        # Look for key= parameter
-        key_match = re.search(r'key\s*=\s*["\']([^"\']+)["\']', match)
-        if key_match:
-            key = key_match.group(1)
-            keys.append(key)
-            print(f"  Chart {i+1}: key='{key}'")
-        else:
-            missing_keys.append(i+1)
-            print(f"  Chart {i+1}: ⚠️  NO KEY")
+    stat = os.stat("app.py")
+    n_charts, missing_keys, dups = _scan(
+        "app.py", stat.st_mtime_ns, stat.st_size
+    )
+
+    print(f"\nFound {n_charts} st.plotly_chart calls")
 
     # Assert all charts have keys
-    assert len(missing_keys) == 0, f"Charts missing keys: {missing_keys}"
+    if missing_keys:
+        print("\n".join(f"  Chart {i}: ⚠️  NO KEY" for i in missing_keys))
+    assert len(missing_keys) == 0, f"Charts missing keys: {list(missing_keys)}"
 
     # Assert all keys are unique
-    duplicate_keys = [k for k in keys if keys.count(k) > 1]
-    assert len(duplicate_keys) == 0, f"Duplicate keys found: {set(duplicate_keys)}"
+    assert not dups, f"Duplicate keys found: {set(dups)}"
 
-    print(f"\n✓ All {len(matches)} charts have unique keys")
+    print(f"\n✓ All {n_charts} charts have unique keys")
 
 
 if __name__ == "__main__":